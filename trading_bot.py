@@ -1,210 +1,703 @@
-import argparse
-import logging
-import sys
-import time
-from binance import Client
-from binance.exceptions import BinanceAPIException
-
-class BasicBot:
-    def __init__(self, api_key, api_secret):
-        """
-        Initialize trading bot with Binance API credentials
-        """
-        # Configure logging first
-        self.logger = logging.getLogger("BinanceBot")
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('trading_bot.log', encoding='utf-8')
-            ]
-        )
-
-        try:
-            # Initialize client with testnet configuration
-            self.client = Client(
-                api_key=api_key,
-                api_secret=api_secret,
-                testnet=True
-            )
-            
-            # Test API connectivity
-            self.test_connection()
-            self.logger.info("Trading bot initialized successfully")
-            
-        except Exception as e:
-            self.logger.error("Initialization failed: %s", str(e))
-            raise
-
-    def test_connection(self):
-        """Verify API credentials and connectivity"""
-        try:
-            # Test connectivity
-            start_time = time.time()
-            self.client.futures_ping()
-            ping_time = (time.time() - start_time) * 1000
-            
-            # Get server time
-            server_time = self.client.futures_time()
-            human_time = time.strftime('%Y-%m-%d %H:%M:%S', 
-                                    time.gmtime(server_time['serverTime']/1000))
-            
-            self.logger.info("API Connection Successful | Ping: %.2fms", ping_time)
-            self.logger.info("Binance Server Time: %s UTC", human_time)
-            
-            # Check account status
-            account_info = self.client.futures_account()
-            self.logger.info("Account Status: CanTrade=%s", account_info['canTrade'])
-            
-            # Check balance
-            balance = self.client.futures_account_balance()
-            usdt_balance = next((item for item in balance if item['asset'] == 'USDT'), None)
-            
-            if usdt_balance:
-                self.logger.info("Available Balance: %s USDT", usdt_balance['balance'])
-            else:
-                self.logger.warning("No USDT balance found")
-                
-        except BinanceAPIException as e:
-            self.logger.error("API Error: %s - %s", e.status_code, e.message)
-            raise
-        except Exception as e:
-            self.logger.error("Connection test failed: %s", str(e))
-            raise
-
-    def place_order(self, symbol, side, order_type, quantity, price=None):
-        """
-        Place futures order with validation and error handling
-        """
-        try:
-            # Input validation
-            symbol = symbol.upper().strip()
-            if not symbol.endswith('USDT'):
-                raise ValueError("Symbol must be a USDT-M pair (e.g., BTCUSDT)")
-                
-            side = side.upper().strip()
-            if side not in ['BUY', 'SELL']:
-                raise ValueError("Side must be 'BUY' or 'SELL'")
-                
-            quantity = float(quantity)
-            if quantity <= 0:
-                raise ValueError("Quantity must be positive")
-                
-            order_type = order_type.upper().strip()
-            valid_types = ['MARKET', 'LIMIT']
-            if order_type not in valid_types:
-                raise ValueError("Order type must be MARKET or LIMIT")
-
-            # Prepare order parameters
-            params = {
-                'symbol': symbol,
-                'side': side,
-                'type': order_type,
-                'quantity': quantity
-            }
-
-            # Add price for limit orders
-            if order_type == 'LIMIT':
-                if price is None:
-                    raise ValueError("Price is required for limit orders")
-                    
-                price = float(price)
-                if price <= 0:
-                    raise ValueError("Price must be positive")
-                    
-                params['price'] = price
-                params['timeInForce'] = 'GTC'
-
-            self.logger.info("Placing order: %s", params)
-            response = self.client.futures_create_order(**params)
-            self.logger.info("Order successful: %s", response)
-            return response
-            
-        except BinanceAPIException as e:
-            error_msg = f"API Error {e.status_code}: {e.message}"
-            self.logger.error(error_msg)
-            raise RuntimeError(error_msg)
-        except Exception as e:
-            error_msg = f"Order failed: {str(e)}"
-            self.logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
-def main():
-    # Handle Unicode output for Windows
-    if sys.platform == "win32":
-        import io
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    
-    # Command-line interface setup
-    parser = argparse.ArgumentParser(
-        description='Binance Futures Testnet Trading Bot',
-        epilog="Examples:\n"
-               "  Market Buy: python trading_bot.py BTCUSDT buy market 0.001 --api_key YOUR_KEY --api_secret YOUR_SECRET\n"
-               "  Limit Sell: python trading_bot.py ETHUSDT sell limit 0.1 2500 --api_key YOUR_KEY --api_secret YOUR_SECRET"
-    )
-    
-    # Required arguments
-    parser.add_argument('symbol', help='Trading pair (e.g., BTCUSDT)')
-    parser.add_argument('side', choices=['buy', 'sell'], help='Order side')
-    parser.add_argument('type', choices=['market', 'limit'], help='Order type')
-    parser.add_argument('quantity', type=float, help='Order quantity')
-    parser.add_argument('price', nargs='?', type=float, default=None,
-                       help='Price for limit orders (required for limit type)')
-    parser.add_argument('--api_key', required=True, help='Binance API key')
-    parser.add_argument('--api_secret', required=True, help='Binance API secret')
-    
-    args = parser.parse_args()
-    
-    try:
-        # Initialize bot
-        print("Initializing bot and testing API credentials...")
-        bot = BasicBot(args.api_key, args.api_secret)
-        
-        # Validate limit order price requirement
-        if args.type == 'limit' and args.price is None:
-            raise ValueError("Price is required for limit orders")
-        
-        # Place order
-        print("Placing order...")
-        response = bot.place_order(
-            symbol=args.symbol,
-            side=args.side,
-            order_type=args.type,
-            quantity=args.quantity,
-            price=args.price
-        )
-        
-        # Output order details
-        print("\n" + "="*50)
-        print("[SUCCESS] Order Execution Details:")
-        print("="*50)
-        print(f"Order ID: {response['orderId']}")
-        print(f"Symbol: {response['symbol']}")
-        print(f"Status: {response['status']}")
-        print(f"Side: {response['side']}")
-        print(f"Type: {response['type']}")
-        print(f"Quantity: {response['origQty']}")
-        if 'price' in response:
-            print(f"Price: {response['price']}")
-        print(f"Executed Qty: {response['executedQty']}")
-        if 'avgPrice' in response:
-            print(f"Avg Price: {response['avgPrice']}")
-        print("="*50)
-        print("Check Binance Testnet for full order details")
-        print("https://testnet.binancefuture.com")
-        
-    except ValueError as e:
-        print(f"\n[ERROR] Validation Error: {str(e)}")
-        print("Use -h for help with command usage")
-        exit(1)
-    except RuntimeError as e:
-        print(f"\n[ERROR] Trading Error: {str(e)}")
-        exit(1)
-    except Exception as e:
-        print(f"\n[ERROR] Unexpected Error: {str(e)}")
-        exit(1)
-
-if __name__ == "__main__":
-    main()
+import argparse
+import asyncio
+import atexit
+import functools
+import hashlib
+import hmac
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from decimal import Decimal
+from urllib.parse import urlencode
+
+# orjson decodes/encodes JSON several times faster than the stdlib;
+# fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Futures testnet endpoints: REST base for direct signed calls and the
+# WebSocket API (order placement over a persistent socket instead of
+# per-order HTTP requests)
+FUTURES_REST_URL = 'https://testnet.binancefuture.com'
+FUTURES_WS_API_URL = 'wss://testnet.binancefuture.com/ws-fapi/v1'
+
+# Valid order fields as frozensets: O(1) membership tests with no
+# per-call list allocation in the order path
+_SIDES = frozenset(('BUY', 'SELL'))
+_TYPES = frozenset(('MARKET', 'LIMIT'))
+
+# Cached Decimal parser: repeated quantities/prices/filter steps skip
+# re-parsing, and Decimal avoids float round-off that the order server
+# would reject against LOT_SIZE/PRICE_FILTER
+_dec = functools.lru_cache(maxsize=1024)(Decimal)
+
+# Pre-interned request-dict keys, and a per-thread params buffer that
+# gets cleared and refilled instead of reallocated on every order
+_K_SYMBOL, _K_SIDE, _K_TYPE, _K_QTY, _K_PRICE, _K_TIF = map(
+    sys.intern, ('symbol', 'side', 'type', 'quantity', 'price', 'timeInForce'))
+
+_buf = threading.local()
+
+def _params_buffer():
+    """Return this thread's reusable params dict, cleared for refill"""
+    params = getattr(_buf, 'params', None)
+    if params is None:
+        params = _buf.params = {}
+    else:
+        params.clear()
+    return params
+
+# Configure logging once per process. The stream and file handlers sit
+# behind a QueueListener on a background thread, so log calls on the
+# order path only do a lockless queue put instead of a disk write
+if not logging.getLogger().handlers:
+    _log_queue = queue.SimpleQueue()
+    _log_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    _log_handlers = (
+        logging.StreamHandler(),
+        # delay=True defers opening the log file until the first record
+        # is emitted, keeping import/constructor paths free of file I/O
+        logging.FileHandler('trading_bot.log', encoding='utf-8', delay=True)
+    )
+    for _handler in _log_handlers:
+        _handler.setFormatter(_log_formatter)
+    _log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(_log_queue)]
+    )
+
+# Cache clients per credential pair so repeated invocations in the same
+# interpreter reuse the pooled keep-alive connections
+_client_cache = {}
+
+def _get_client(api_key, api_secret):
+    """Return a cached Client with a keep-alive connection pool mounted"""
+    cached = _client_cache.get((api_key, api_secret))
+    if cached is not None:
+        return cached
+
+    # Imported here so `python trading_bot.py -h` doesn't pay the
+    # import cost of python-binance and its HTTP stack
+    import requests.adapters
+    from binance import Client
+
+    # Route response decoding through orjson so order responses (and
+    # batch responses in particular) parse off the critical path faster
+    if orjson is not None:
+        requests.models.Response.json = (
+            lambda self, **kwargs: orjson.loads(self.content))
+
+    client = Client(
+        api_key=api_key,
+        api_secret=api_secret,
+        testnet=True
+    )
+
+    # Reuse one TLS session across the startup REST calls and order
+    # placement instead of paying a TCP+TLS handshake per request
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=0
+    )
+    client.session.mount('https://', adapter)
+    client.session.headers.update({
+        'Connection': 'keep-alive',
+        'Keep-Alive': 'timeout=90, max=1000'
+    })
+
+    _client_cache[(api_key, api_secret)] = client
+    return client
+
+class WsOrderClient:
+    """
+    Persistent WebSocket API connection for low-latency order placement.
+
+    Runs an asyncio event loop on a daemon thread; each request is sent
+    as one WS frame and matched to its response by id, so orders skip
+    per-request HTTP framing and connection setup entirely.
+    """
+
+    def __init__(self, api_key, api_secret, url=FUTURES_WS_API_URL,
+                 timeout=5.0, timestamp_offset=0):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.url = url
+        self.timeout = timeout
+        self.timestamp_offset = timestamp_offset
+        self.logger = logging.getLogger("BinanceBot")
+        self._loop = None
+        self._thread = None
+        self._ws = None
+        self._reader_task = None
+        self._pending = {}
+
+    @property
+    def connected(self):
+        return self._ws is not None
+
+    def connect(self):
+        """Open the socket and start the background reader task"""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(self._connect(), self._loop)
+        future.result(timeout=self.timeout)
+
+    async def _connect(self):
+        import websockets
+        self._ws = await websockets.connect(self.url)
+        self._reader_task = asyncio.ensure_future(self._reader())
+
+    async def _reader(self):
+        """Resolve pending request futures as responses arrive"""
+        try:
+            async for message in self._ws:
+                response = _json_loads(message)
+                waiter = self._pending.pop(response.get('id'), None)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(response)
+        except Exception as e:
+            self.logger.warning("WebSocket reader stopped: %s", str(e))
+        finally:
+            self._ws = None
+            for waiter in self._pending.values():
+                if not waiter.done():
+                    waiter.set_exception(ConnectionError("WebSocket connection closed"))
+            self._pending.clear()
+
+    def _sign(self, params):
+        """Attach apiKey/timestamp and HMAC-SHA256 signature"""
+        signed = dict(params)
+        signed['apiKey'] = self.api_key
+        signed['timestamp'] = time.time_ns() // 1_000_000 + self.timestamp_offset
+        query = urlencode(sorted(signed.items()))
+        signed['signature'] = hmac.new(
+            self.api_secret.encode(), query.encode(), hashlib.sha256
+        ).hexdigest()
+        return signed
+
+    def place_order(self, params):
+        """Place one order over the persistent socket"""
+        request_id = str(uuid.uuid4())
+        payload = {
+            'id': request_id,
+            'method': 'order.place',
+            'params': self._sign(params)
+        }
+        future = asyncio.run_coroutine_threadsafe(
+            self._request(request_id, payload), self._loop)
+        try:
+            response = future.result(timeout=self.timeout)
+        except FuturesTimeout:
+            # Cancel the coroutine and drop its waiter so timed-out
+            # orders don't leak pending futures on the loop
+            future.cancel()
+            self._loop.call_soon_threadsafe(
+                self._pending.pop, request_id, None)
+            raise
+
+        if response.get('status') != 200:
+            error = response.get('error', {})
+            raise RuntimeError(
+                f"WebSocket API Error {error.get('code')}: {error.get('msg')}")
+        return response['result']
+
+    async def _request(self, request_id, payload):
+        waiter = asyncio.get_event_loop().create_future()
+        self._pending[request_id] = waiter
+        await self._ws.send(_json_dumps(payload))
+        return await waiter
+
+    async def _cancel_reader(self):
+        self._reader_task.cancel()
+        try:
+            await self._reader_task
+        except asyncio.CancelledError:
+            pass
+
+    def close(self):
+        """Tear down the socket and stop the background loop"""
+        if self._loop is None:
+            return
+        if self._ws is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._ws.close(), self._loop).result(timeout=self.timeout)
+            except Exception:
+                pass
+        # Cancel the reader before stopping the loop so teardown doesn't
+        # destroy a still-pending task
+        if self._reader_task is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._cancel_reader(), self._loop).result(timeout=self.timeout)
+            except Exception:
+                pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+class BasicBot:
+    # Cached level constants for the isEnabledFor gates on the order path
+    INFO = logging.INFO
+    DEBUG = logging.DEBUG
+
+    # Transient failures worth retrying: request-rate limits and
+    # CloudFront 503s. Everything else fails fast
+    _RETRIABLE_CODES = frozenset((-1003, -1015))
+    _MAX_ATTEMPTS = 5
+    _RETRY_BUDGET = 30.0
+
+    def __init__(self, api_key, api_secret):
+        """
+        Initialize trading bot with Binance API credentials
+        """
+        self.logger = logging.getLogger("BinanceBot")
+        self.api_key = api_key
+        self.api_secret = api_secret
+
+        from binance.exceptions import BinanceAPIException
+        self._BinanceAPIException = BinanceAPIException
+
+        try:
+            # Initialize client with testnet configuration (cached, with
+            # a keep-alive connection pool)
+            self.client = _get_client(api_key, api_secret)
+
+            # Measure the server-time offset once and reuse it for every
+            # signed request instead of paying extra /fapi/v1/time
+            # round-trips later
+            local_ms = time.time_ns() // 1_000_000
+            server_ms = self.client.futures_time()['serverTime']
+            self._offset = server_ms - local_ms
+            self.client.timestamp_offset = self._offset
+
+            # Test API connectivity
+            self.test_connection()
+
+            # Cache symbol filters once so order validation can quantize
+            # price/quantity locally instead of round-tripping to Binance
+            # just to be rejected
+            info = self.client.futures_exchange_info()
+            self._filters = {
+                s['symbol']: {f['filterType']: f for f in s['filters']}
+                for s in info['symbols']
+            }
+
+            # Open a persistent WebSocket API connection so order
+            # placement reuses one socket; REST remains the fallback
+            self.ws_client = WsOrderClient(
+                api_key, api_secret, timestamp_offset=self._offset)
+            try:
+                self.ws_client.connect()
+                self.logger.info("WebSocket order connection established")
+            except Exception as e:
+                self.ws_client = None
+                self.logger.warning(
+                    "WebSocket unavailable, using REST for orders: %s", str(e))
+
+            self.logger.info("Trading bot initialized successfully")
+            
+        except Exception as e:
+            self.logger.error("Initialization failed: %s", str(e))
+            raise
+
+    def _diagnostics_http2(self):
+        """
+        Run the startup checks multiplexed over one HTTP/2 connection.
+
+        Returns (ping_ms, account_info, balance), or None when httpx
+        isn't installed so the caller falls back to the thread pool.
+        """
+        try:
+            import httpx
+        except ImportError:
+            return None
+
+        secret = self.api_secret.encode()
+
+        def signed_params():
+            params = {'timestamp': time.time_ns() // 1_000_000 + self._offset}
+            query = urlencode(params)
+            params['signature'] = hmac.new(
+                secret, query.encode(), hashlib.sha256).hexdigest()
+            return params
+
+        async def run():
+            limits = httpx.Limits(max_keepalive_connections=10)
+            async with httpx.AsyncClient(
+                    http2=True,
+                    base_url=FUTURES_REST_URL,
+                    limits=limits,
+                    headers={'X-MBX-APIKEY': self.api_key}) as client:
+
+                def check(response):
+                    # Keep Binance's code/msg from the body instead of
+                    # httpx's generic status-only message
+                    if response.is_error:
+                        raise RuntimeError(
+                            f"API Error {response.status_code}: {response.text}")
+                    return response
+
+                async def ping():
+                    t0 = time.perf_counter_ns()
+                    check(await client.get('/fapi/v1/ping'))
+                    return (time.perf_counter_ns() - t0) / 1e6
+
+                async def get_signed(path):
+                    response = await client.get(path, params=signed_params())
+                    return check(response).json()
+
+                # All three share one TLS session with no head-of-line
+                # blocking between the multiplexed streams
+                return await asyncio.gather(
+                    ping(),
+                    get_signed('/fapi/v2/account'),
+                    get_signed('/fapi/v2/balance'))
+
+        try:
+            return asyncio.run(run())
+        except ImportError:
+            # httpx raises ImportError from AsyncClient(http2=True) when
+            # the h2 extra isn't installed; fall back like missing httpx
+            return None
+
+    def test_connection(self):
+        """Verify API credentials and connectivity"""
+        try:
+            results = self._diagnostics_http2()
+            if results is not None:
+                ping_time, account_info, balance = results
+            else:
+                # Fall back to firing the checks concurrently over the
+                # HTTP/1.1 keep-alive pool; perf_counter_ns is monotonic
+                # with ns resolution, so the ping measurement doesn't
+                # inherit wall-clock jitter
+                t0 = time.perf_counter_ns()
+                with ThreadPoolExecutor(max_workers=3) as pool:
+                    ping_future = pool.submit(self.client.futures_ping)
+                    account_future = pool.submit(self.client.futures_account)
+                    balance_future = pool.submit(
+                        self.client.futures_account_balance)
+
+                    ping_future.result()
+                    ping_time = (time.perf_counter_ns() - t0) / 1e6
+                    account_info = account_future.result()
+                    balance = balance_future.result()
+
+            # Server time comes from the offset cached at init; no
+            # extra round-trip needed just for logging
+            server_ms = time.time_ns() // 1_000_000 + self._offset
+            human_time = time.strftime('%Y-%m-%d %H:%M:%S',
+                                    time.gmtime(server_ms / 1000))
+
+            self.logger.info("API Connection Successful | Ping: %.2fms", ping_time)
+            self.logger.info("Binance Server Time: %s UTC", human_time)
+
+            # Check account status
+            self.logger.info("Account Status: CanTrade=%s", account_info['canTrade'])
+
+            # Check balance (index by asset so further lookups are O(1))
+            by_asset = {b['asset']: b for b in balance}
+            usdt_balance = by_asset.get('USDT')
+
+            if usdt_balance:
+                self.logger.info("Available Balance: %s USDT", usdt_balance['balance'])
+            else:
+                self.logger.warning("No USDT balance found")
+                
+        except self._BinanceAPIException as e:
+            self.logger.error("API Error: %s - %s", e.status_code, e.message)
+            raise
+        except Exception as e:
+            self.logger.error("Connection test failed: %s", str(e))
+            raise
+
+    # Key templates for the specialized param builders; the interned
+    # keys hash by pointer and the zip fills the dict in one pass
+    _MARKET_TEMPLATE = (_K_SYMBOL, _K_SIDE, _K_TYPE, _K_QTY)
+    _LIMIT_TEMPLATE = (_K_SYMBOL, _K_SIDE, _K_TYPE, _K_QTY, _K_PRICE, _K_TIF)
+
+    def _place_market(self, symbol, side, quantity, price=None):
+        """Build request params for a MARKET order"""
+        params = _params_buffer()
+        params.update(zip(self._MARKET_TEMPLATE,
+                          (symbol, side, 'MARKET', quantity)))
+        return params
+
+    def _place_limit(self, symbol, side, quantity, price=None):
+        """Build request params for a LIMIT order; price checks live here"""
+        if price is None:
+            raise ValueError("Price is required for limit orders")
+
+        price = _dec(str(price))
+        if price <= 0:
+            raise ValueError("Price must be positive")
+
+        params = _params_buffer()
+        params.update(zip(self._LIMIT_TEMPLATE,
+                          (symbol, side, 'LIMIT', quantity, price, 'GTC')))
+        return params
+
+    _BUILDERS = {'MARKET': _place_market, 'LIMIT': _place_limit}
+
+    def _retry(self, send):
+        """
+        Call send() with exponential backoff plus jitter on transient
+        errors, bounded by a total latency budget so callers aren't
+        stalled indefinitely
+        """
+        deadline = time.monotonic() + self._RETRY_BUDGET
+        for attempt in range(self._MAX_ATTEMPTS):
+            try:
+                return send()
+            except self._BinanceAPIException as e:
+                retriable = (e.code in self._RETRIABLE_CODES
+                             or e.status_code == 503)
+                delay = min(2 ** attempt, 32) + random.random() * 0.25
+                if (not retriable
+                        or attempt == self._MAX_ATTEMPTS - 1
+                        or time.monotonic() + delay > deadline):
+                    raise
+                self.logger.warning(
+                    "Transient API error %s (HTTP %s), retrying in %.2fs",
+                    e.code, e.status_code, delay)
+                time.sleep(delay)
+
+    def _validate(self, symbol, side, order_type, quantity, price=None):
+        """Validate order fields and return the request parameters dict"""
+        symbol = sys.intern(symbol.strip().upper())
+        if not symbol.endswith('USDT'):
+            raise ValueError("Symbol must be a USDT-M pair (e.g., BTCUSDT)")
+
+        side = side.strip().upper()
+        if side not in _SIDES:
+            raise ValueError("Side must be 'BUY' or 'SELL'")
+
+        quantity = _dec(str(quantity))
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive")
+
+        order_type = order_type.strip().upper()
+        if order_type not in _TYPES:
+            raise ValueError("Order type must be MARKET or LIMIT")
+
+        # Dispatch once to the straight-line builder for this order type
+        params = self._BUILDERS[order_type](self, symbol, side, quantity, price)
+
+        # Enforce the symbol's exchange filters locally (a dict lookup
+        # and a quantize vs a full rejection round-trip)
+        filters = self._filters.get(symbol)
+        if filters:
+            step = _dec(filters['LOT_SIZE']['stepSize'])
+            quantity = (quantity // step) * step
+            if quantity <= 0:
+                raise ValueError(
+                    f"Quantity below minimum step size {step} for {symbol}")
+            params['quantity'] = quantity
+
+            if 'price' in params:
+                tick = _dec(filters['PRICE_FILTER']['tickSize'])
+                price = (params['price'] // tick) * tick
+                if price <= 0:
+                    raise ValueError(
+                        f"Price below minimum tick size {tick} for {symbol}")
+                params['price'] = price
+
+                min_notional = filters.get('MIN_NOTIONAL')
+                if min_notional is not None:
+                    notional = quantity * price
+                    if notional < _dec(min_notional['notional']):
+                        raise ValueError(
+                            f"Order notional {notional} below minimum "
+                            f"{min_notional['notional']} for {symbol}")
+
+        # Binance accepts string-formatted decimals natively; sending
+        # strings sidesteps float round-off in the request body
+        params['quantity'] = format(params['quantity'], 'f')
+        if 'price' in params:
+            params['price'] = format(params['price'], 'f')
+
+        return params
+
+    def place_orders(self, orders):
+        """
+        Place multiple futures orders, batched 5 per HTTP round-trip via
+        the batch order endpoint; returns the concatenated response list
+        """
+        try:
+            # Copy each params dict out of the shared per-thread buffer
+            validated = [dict(self._validate(**order)) for order in orders]
+
+            responses = []
+            for start in range(0, len(validated), 5):
+                chunk = validated[start:start + 5]
+                if self.logger.isEnabledFor(self.DEBUG):
+                    self.logger.debug(f"Placing batch of {len(chunk)} orders: {chunk}")
+                responses.extend(self._retry(
+                    lambda: self.client.futures_place_batch_order(
+                        batchOrders=chunk)))
+
+            if self.logger.isEnabledFor(self.INFO):
+                self.logger.info(f"Batch orders successful: {responses}")
+            return responses
+
+        except self._BinanceAPIException as e:
+            error_msg = f"API Error {e.status_code}: {e.message}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        except Exception as e:
+            error_msg = f"Order failed: {str(e)}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+    def place_order(self, symbol, side, order_type, quantity, price=None):
+        """
+        Place futures order with validation and error handling
+        """
+        try:
+            params = self._validate(symbol, side, order_type, quantity, price)
+
+            # One INFO record per order (request and response together);
+            # the pre-call record only exists at DEBUG. Gating on the
+            # level keeps dict stringification off the disabled paths
+            if self.logger.isEnabledFor(self.DEBUG):
+                self.logger.debug(f"Placing order: {params}")
+            if self.ws_client is not None and self.ws_client.connected:
+                # Copy so the request never aliases the reused buffer
+                response = self.ws_client.place_order(params.copy())
+            else:
+                response = self._retry(
+                    lambda: self.client.futures_create_order(**params))
+            if self.logger.isEnabledFor(self.INFO):
+                self.logger.info(
+                    f"Order ok | req={params} "
+                    f"resp_id={response.get('orderId')} "
+                    f"status={response.get('status')}")
+            return response
+            
+        except self._BinanceAPIException as e:
+            error_msg = f"API Error {e.status_code}: {e.message}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        except Exception as e:
+            error_msg = f"Order failed: {str(e)}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the CLI parser once; re-entrant calls reuse it"""
+    parser = argparse.ArgumentParser(
+        description='Binance Futures Testnet Trading Bot',
+        epilog="Examples:\n"
+               "  Market Buy: python trading_bot.py BTCUSDT buy market 0.001 --api_key YOUR_KEY --api_secret YOUR_SECRET\n"
+               "  Limit Sell: python trading_bot.py ETHUSDT sell limit 0.1 2500 --api_key YOUR_KEY --api_secret YOUR_SECRET"
+    )
+    
+    # Required arguments
+    parser.add_argument('symbol', help='Trading pair (e.g., BTCUSDT)')
+    parser.add_argument('side', choices=['buy', 'sell'], help='Order side')
+    parser.add_argument('type', choices=['market', 'limit'], help='Order type')
+    parser.add_argument('quantity', type=float, help='Order quantity')
+    parser.add_argument('price', nargs='?', type=float, default=None,
+                       help='Price for limit orders (required for limit type)')
+    parser.add_argument('--api_key', required=True, help='Binance API key')
+    parser.add_argument('--api_secret', required=True, help='Binance API secret')
+
+    return parser
+
+def main():
+    # Handle Unicode output for Windows (no-op if stdout is already
+    # UTF-8 or was rewrapped by an earlier call)
+    if sys.platform == "win32" and getattr(sys.stdout, 'encoding', '').lower() != 'utf-8':
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    args = _build_parser().parse_args()
+
+    try:
+        # Initialize bot
+        print("Initializing bot and testing API credentials...")
+        bot = BasicBot(args.api_key, args.api_secret)
+        
+        # Validate limit order price requirement
+        if args.type == 'limit' and args.price is None:
+            raise ValueError("Price is required for limit orders")
+        
+        # Place order
+        print("Placing order...")
+        response = bot.place_order(
+            symbol=args.symbol,
+            side=args.side,
+            order_type=args.type,
+            quantity=args.quantity,
+            price=args.price
+        )
+        
+        # Output order details in one buffered write instead of a dozen
+        # line-buffered print calls
+        sep = "=" * 50
+        lines = [
+            "",
+            sep,
+            "[SUCCESS] Order Execution Details:",
+            sep,
+            f"Order ID: {response['orderId']}",
+            f"Symbol: {response['symbol']}",
+            f"Status: {response['status']}",
+            f"Side: {response['side']}",
+            f"Type: {response['type']}",
+            f"Quantity: {response['origQty']}",
+        ]
+        if 'price' in response:
+            lines.append(f"Price: {response['price']}")
+        lines.append(f"Executed Qty: {response['executedQty']}")
+        if 'avgPrice' in response:
+            lines.append(f"Avg Price: {response['avgPrice']}")
+        lines.extend([
+            sep,
+            "Check Binance Testnet for full order details",
+            "https://testnet.binancefuture.com",
+            ""
+        ])
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
+
+    except ValueError as e:
+        print(f"\n[ERROR] Validation Error: {str(e)}")
+        print("Use -h for help with command usage")
+        exit(1)
+    except RuntimeError as e:
+        print(f"\n[ERROR] Trading Error: {str(e)}")
+        exit(1)
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected Error: {str(e)}")
+        exit(1)
+
+if __name__ == "__main__":
+    main()
     
\ No newline at end of file